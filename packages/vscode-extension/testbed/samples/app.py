@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from hashlib import sha256
 from typing import AsyncIterator, Callable, Generic, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -18,14 +21,14 @@ T = TypeVar('T')
 R = TypeVar('R')
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
     requests_per_second: float = 10.0
     burst_size: int = 20
     retry_after_seconds: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult(Generic[T]):
     success: bool
     value: T | None = None
@@ -36,29 +39,36 @@ class ProcessingResult(Generic[T]):
 # !! Rate limiter is not distributed - only works for single instance
 class TokenBucketRateLimiter:
     def __init__(self, config: RateLimitConfig):
+        if config.requests_per_second <= 0:
+            raise ValueError(
+                f"requests_per_second must be positive, got {config.requests_per_second}"
+            )
         self.config = config
         self.tokens = float(config.burst_size)
-        self.last_update = datetime.now()
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> bool:
-        async with self._lock:
-            now = datetime.now()
-            elapsed = (now - self.last_update).total_seconds()
-            self.tokens = min(
-                self.config.burst_size,
-                self.tokens + elapsed * self.config.requests_per_second
-            )
-            self.last_update = now
-
-            if self.tokens >= 1.0:
-                self.tokens -= 1.0
-                return True
-            return False
+        self.last_update_ns = time.monotonic_ns()
+        # Derived once; the config is frozen, so these never go stale
+        self._capacity = float(config.burst_size)
+        self._tokens_per_ns = config.requests_per_second * 1e-9
+        self._seconds_per_token = 1.0 / config.requests_per_second
+
+    # No lock needed: nothing here awaits, so it runs atomically on the loop
+    def acquire(self) -> bool:
+        now_ns = time.monotonic_ns()
+        self.tokens = min(
+            self._capacity,
+            self.tokens + (now_ns - self.last_update_ns) * self._tokens_per_ns
+        )
+        self.last_update_ns = now_ns
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
 
     async def wait_for_token(self) -> None:
-        while not await self.acquire():
-            await asyncio.sleep(0.1)
+        while not self.acquire():
+            # Sleep until the next whole token has refilled, not a fixed tick
+            await asyncio.sleep((1.0 - self.tokens) * self._seconds_per_token)
 
 
 @dataclass
@@ -67,66 +77,123 @@ class BatchProcessor(Generic[T, R]):
     rate_limiter: TokenBucketRateLimiter
     max_concurrent: int = 10
     timeout_seconds: float = 30.0
-    _semaphore: asyncio.Semaphore = field(init=False)
+    # Call cheap process_fns directly; a thread hop costs more than they do.
+    # Inline calls run on the event loop: process_fn must be fast and
+    # non-blocking, and timeout_seconds does not apply to them
+    run_inline: bool = False
+    # Created on first use, so inline-only processors never start threads.
+    # A call that outlives its timeout keeps its pool thread until it
+    # returns; later items queue behind it, but their timeout only starts
+    # once process_fn actually begins
+    _executor: ThreadPoolExecutor | None = field(
+        default=None, init=False, repr=False
+    )
 
-    def __post_init__(self):
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+    async def __aenter__(self) -> BatchProcessor[T, R]:
+        return self
 
-    async def process_item(self, item: T) -> ProcessingResult[R]:
-        start = datetime.now()
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            # Sized to match max_concurrent instead of the loop's default pool
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
+        return self._executor
+
+    async def aclose(self) -> None:
+        """Shut down the worker threads without blocking the event loop."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown)
+
+    async def _run_in_executor(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+
+        def mark_started() -> None:
+            if not started.done():
+                started.set_result(None)
+
+        def call() -> R:
+            loop.call_soon_threadsafe(mark_started)
+            return self.process_fn(item)
 
+        job = loop.run_in_executor(self._get_executor(), call)
         try:
-            await self.rate_limiter.wait_for_token()
+            # Time spent queued behind busy pool threads is not the item's fault
+            await started
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+        return await asyncio.wait_for(job, timeout=self.timeout_seconds)
 
-            async with self._semaphore:
-                result = await asyncio.wait_for(
-                    asyncio.to_thread(self.process_fn, item),
-                    timeout=self.timeout_seconds
-                )
+    async def process_item(self, item: T) -> ProcessingResult[R]:
+        start_ns = time.monotonic_ns()
+        result: R | None = None
+        error: str | None = None
 
-                duration = (datetime.now() - start).total_seconds() * 1000
-                return ProcessingResult(
-                    success=True,
-                    value=result,
-                    duration_ms=duration
-                )
+        try:
+            await self.rate_limiter.wait_for_token()
 
+            if self.run_inline:
+                result = self.process_fn(item)
+            else:
+                result = await self._run_in_executor(item)
         except asyncio.TimeoutError:
-            duration = (datetime.now() - start).total_seconds() * 1000
-            return ProcessingResult(
-                success=False,
-                error="Processing timeout",
-                duration_ms=duration
-            )
+            error = "Processing timeout"
         except Exception as e:
-            duration = (datetime.now() - start).total_seconds() * 1000
-            logger.exception("Processing failed")
-            return ProcessingResult(
-                success=False,
-                error=str(e),
-                duration_ms=duration
+            error = str(e)
+            # Formatting a traceback is costly; only do it when debugging
+            logger.warning(
+                "Processing failed: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
             )
 
+        return ProcessingResult(
+            success=error is None,
+            value=result,
+            error=error,
+            duration_ms=(time.monotonic_ns() - start_ns) / 1e6
+        )
+
     # ?? Should we add backpressure when too many failures occur?
     async def process_batch(
         self,
         items: list[T]
     ) -> AsyncIterator[tuple[T, ProcessingResult[R]]]:
-        tasks = [
-            asyncio.create_task(self._process_with_item(item))
-            for item in items
+        # A fixed pool of workers pulls from one shared iterator, so the
+        # task count is bounded by max_concurrent, not by len(items)
+        remaining = iter(items)
+        finished: asyncio.Queue[
+            tuple[T, ProcessingResult[R]] | Exception
+        ] = asyncio.Queue()
+
+        async def worker() -> None:
+            # Bound once per worker rather than looked up per item
+            process_item = self.process_item
+            put = finished.put_nowait
+            try:
+                for item in remaining:
+                    put((item, await process_item(item)))
+            except Exception as e:
+                # Hand the failure to the consumer, which would otherwise
+                # wait forever on results this worker will never produce
+                put(e)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrent, len(items)))
         ]
-
-        for task in asyncio.as_completed(tasks):
-            item, result = await task
-            yield item, result
-
-    async def _process_with_item(
-        self,
-        item: T
-    ) -> tuple[T, ProcessingResult[R]]:
-        result = await self.process_item(item)
-        return item, result
+        try:
+            for _ in range(len(items)):
+                entry = await finished.get()
+                if isinstance(entry, Exception):
+                    raise entry
+                yield entry
+        finally:
+            for task in workers:
+                task.cancel()
 
 
 def normalize_text(text: str) -> str:
@@ -136,14 +203,11 @@ def normalize_text(text: str) -> str:
 
 def compute_hash(data: bytes) -> str:
     """Compute SHA-256 hash of data."""
-    import hashlib
-    return hashlib.sha256(data).hexdigest()
+    return sha256(data).hexdigest()
 
 
 # >> Entry point validates environment before starting processor
 async def main() -> None:
-    import os
-
     api_key = os.environ.get('API_KEY')
     if not api_key:
         raise RuntimeError("API_KEY environment variable required")
@@ -158,17 +222,28 @@ async def main() -> None:
     processor: BatchProcessor[str, str] = BatchProcessor(
         process_fn=normalize_text,
         rate_limiter=rate_limiter,
-        max_concurrent=5
+        max_concurrent=5,
+        run_inline=True
     )
 
     items = ["Hello World", "  Test Input  ", "UPPERCASE TEXT"]
 
-    async for item, result in processor.process_batch(items):
-        if result.success:
-            print(f"Processed '{item}' -> '{result.value}' ({result.duration_ms:.1f}ms)")
-        else:
-            print(f"Failed '{item}': {result.error}")
+    async with processor:
+        async for item, result in processor.process_batch(items):
+            if result.success:
+                print(f"Processed '{item}' -> '{result.value}' ({result.duration_ms:.1f}ms)")
+            else:
+                print(f"Failed '{item}': {result.error}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; fall back to the stock event loop without it
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
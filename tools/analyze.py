@@ -8,10 +8,18 @@ Reads from palette.toml (the single source of truth).
 Usage: python3 analyze.py [--no-color] [--section SECTION]
 """
 
+import bisect
+import functools
 import math
 import sys
 from pathlib import Path
 
+# Shared palette reader; importable both as a script and as tools.analyze
+if __package__:
+    from .lib.palette import load_palette
+else:
+    from lib.palette import load_palette
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Color Math (sRGB <-> OKLab <-> OKLCH)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -29,12 +37,19 @@ def rgb_to_hex(r: float, g: float, b: float) -> str:
 def srgb_to_linear(c: float) -> float:
     return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
 
+# 8-bit channel -> linear light; every hex channel is one of these 256 values
+SRGB_BYTE_TO_LINEAR = tuple(srgb_to_linear(i / 255) for i in range(256))
+
+def hex_to_linear(hex_color: str) -> tuple[float, float, float]:
+    r, g, b = bytes.fromhex(hex_color.strip().lstrip("#"))
+    return SRGB_BYTE_TO_LINEAR[r], SRGB_BYTE_TO_LINEAR[g], SRGB_BYTE_TO_LINEAR[b]
+
 def linear_to_srgb(c: float) -> float:
     return 12.92 * c if c <= 0.0031308 else 1.055 * (c ** (1/2.4)) - 0.055
 
+@functools.lru_cache(maxsize=None)
 def hex_to_oklab(hex_color: str) -> tuple[float, float, float]:
-    r, g, b = hex_to_rgb(hex_color)
-    rl, gl, bl = srgb_to_linear(r), srgb_to_linear(g), srgb_to_linear(b)
+    rl, gl, bl = hex_to_linear(hex_color)
 
     l = 0.4122214708 * rl + 0.5363325363 * gl + 0.0514459929 * bl
     m = 0.2119034982 * rl + 0.6806995451 * gl + 0.1073969566 * bl
@@ -54,16 +69,18 @@ def oklab_to_oklch(L: float, a: float, b: float) -> tuple[float, float, float]:
     h = math.degrees(math.atan2(b, a)) % 360
     return L, C, h
 
+@functools.lru_cache(maxsize=None)
 def hex_to_oklch(hex_color: str) -> tuple[float, float, float]:
     L, a, b = hex_to_oklab(hex_color)
     return oklab_to_oklch(L, a, b)
 
+@functools.lru_cache(maxsize=None)
 def relative_luminance(hex_color: str) -> float:
     """WCAG relative luminance"""
-    r, g, b = hex_to_rgb(hex_color)
-    rl, gl, bl = srgb_to_linear(r), srgb_to_linear(g), srgb_to_linear(b)
+    rl, gl, bl = hex_to_linear(hex_color)
     return 0.2126 * rl + 0.7152 * gl + 0.0722 * bl
 
+@functools.lru_cache(maxsize=None)
 def contrast_ratio(hex1: str, hex2: str) -> float:
     """WCAG contrast ratio"""
     l1 = relative_luminance(hex1)
@@ -78,6 +95,7 @@ def contrast_ratio(hex1: str, hex2: str) -> float:
 
 USE_COLOR = sys.stdout.isatty() and "--no-color" not in sys.argv
 
+@functools.lru_cache(maxsize=None)
 def rgb_bg(hex_color: str) -> str:
     """True color background"""
     if not USE_COLOR:
@@ -85,6 +103,7 @@ def rgb_bg(hex_color: str) -> str:
     r, g, b = hex_to_rgb(hex_color)
     return f"\033[48;2;{int(r*255)};{int(g*255)};{int(b*255)}m"
 
+@functools.lru_cache(maxsize=None)
 def rgb_fg(hex_color: str) -> str:
     """True color foreground"""
     if not USE_COLOR:
@@ -107,26 +126,7 @@ def dim() -> str:
 
 def parse_palette(path: Path) -> dict[str, str]:
     """Parse palette.toml"""
-    colors = {}
-    content = path.read_text()
-
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#') or line.startswith('['):
-            continue
-        if '=' in line and 'base' in line:
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-            # Extract hex from quoted value like: "#1b1d20"    # comment
-            if '"#' in value:
-                # Find the hex value between quotes
-                start = value.index('"#') + 1
-                end = value.index('"', start)
-                hex_val = value[start:end]
-                if len(hex_val) == 7:
-                    colors[key] = hex_val
-
+    colors, _meta = load_palette(path)
     return colors
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -142,16 +142,25 @@ ROLES = {
     'base14': 'quiet cyan', 'base15': 'quiet blue', 'base16': 'quiet purple', 'base17': 'quiet lime',
 }
 
+GRAY_SLOTS = tuple(f"base0{i}" for i in range(8))
+LOUD_SLOTS = tuple(f"base0{c}" for c in "89ABCDEF")
+QUIET_SLOTS = tuple(f"base1{c}" for c in "01234567")
+PAIRS = tuple(zip(LOUD_SLOTS, QUIET_SLOTS))  # (loud, quiet)
+PAIR_NAMES = ("red/pink", "orange", "yellow", "green", "cyan", "blue", "purple", "lime")
+
 HUE_NAMES = {
     (0, 30): "red", (30, 60): "orange", (60, 90): "yellow", (90, 150): "green",
     (150, 210): "cyan", (210, 270): "blue", (270, 330): "purple/magenta", (330, 360): "red"
 }
 
+# Upper edge of each half-open [lo, hi) range, in order, for bisect_right
+_HUE_EDGES, _HUE_BUCKETS = zip(*((hi, name) for (lo, hi), name in sorted(HUE_NAMES.items())))
+
+# HUE_NAMES edges are whole degrees, so one entry per degree covers every hue
+HUE_NAME_BY_DEGREE = tuple(_HUE_BUCKETS[bisect.bisect_right(_HUE_EDGES, d)] for d in range(360))
+
 def hue_name(h: float) -> str:
-    for (lo, hi), name in HUE_NAMES.items():
-        if lo <= h < hi:
-            return name
-    return "red"
+    return HUE_NAME_BY_DEGREE[int(h) % 360]
 
 def print_header(title: str):
     width = 78
@@ -165,21 +174,25 @@ def print_subheader(title: str):
     print(f"  {bold()}── {title} ──{reset()}")
     print()
 
+@functools.lru_cache(maxsize=None)
 def swatch(hex_color: str, width: int = 2) -> str:
     """Create a color swatch"""
     return f"{rgb_bg(hex_color)}{' ' * width}{reset()}"
 
+@functools.lru_cache(maxsize=None)
 def labeled_swatch(hex_color: str, width: int = 6) -> str:
     """Swatch with hex value inside"""
     L, _, _ = hex_to_oklch(hex_color)
     fg = "#000000" if L > 0.6 else "#ffffff"
     return f"{rgb_bg(hex_color)}{rgb_fg(fg)}{hex_color:^{width}}{reset()}"
 
+@functools.lru_cache(maxsize=None)
+def _bar(filled: int, width: int) -> str:
+    return f"{dim()}{'█' * filled}{'░' * (width - filled)}{reset()}"
+
 def lightness_bar(L: float, width: int = 30) -> str:
     """Visual bar showing lightness"""
-    filled = int(L * width)
-    bar = "█" * filled + "░" * (width - filled)
-    return f"{dim()}{bar}{reset()}"
+    return _bar(int(L * width), width)
 
 def delta_indicator(delta: float, threshold_warn: float = 0.15, threshold_bad: float = 0.25) -> str:
     """Color-coded delta indicator"""
@@ -193,8 +206,7 @@ def delta_indicator(delta: float, threshold_warn: float = 0.15, threshold_bad: f
 def analyze_grayscale(colors: dict[str, str]):
     print_header("GRAYSCALE ANALYSIS (base00-base07)")
 
-    slots = [f"base0{i}" for i in range(8)]
-    data = [(slot, colors[slot], *hex_to_oklch(colors[slot])) for slot in slots]
+    data = [(slot, colors[slot], *hex_to_oklch(colors[slot])) for slot in GRAY_SLOTS]
 
     # Table header
     print(f"  {'Slot':<8} {'Hex':<10} {'Swatch':<8} {'L':>6} {'C':>7} {'H':>6}  {'Lightness Bar':<32} Role")
@@ -242,14 +254,11 @@ def analyze_grayscale(colors: dict[str, str]):
 def analyze_accents(colors: dict[str, str]):
     print_header("ACCENT COLORS ANALYSIS")
 
-    loud_slots = ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F']
-    quiet_slots = ['base10', 'base11', 'base12', 'base13', 'base14', 'base15', 'base16', 'base17']
-
     print_subheader("Loud Accents (base08-0F) — Diagnostics & Signals")
     print(f"  {'Slot':<8} {'Hex':<10} {'Swatch':<8} {'L':>6} {'C':>7} {'H':>6}°  Hue Name")
     print(f"  {'─'*8} {'─'*10} {'─'*8} {'─'*6} {'─'*7} {'─'*7}  {'─'*12}")
 
-    for slot in loud_slots:
+    for slot in LOUD_SLOTS:
         hex_val = colors[slot]
         L, C, h = hex_to_oklch(hex_val)
         sw = swatch(hex_val, 6)
@@ -260,32 +269,25 @@ def analyze_accents(colors: dict[str, str]):
     print(f"  {'Slot':<8} {'Hex':<10} {'Swatch':<8} {'L':>6} {'C':>7} {'H':>6}°  Hue Name")
     print(f"  {'─'*8} {'─'*10} {'─'*8} {'─'*6} {'─'*7} {'─'*7}  {'─'*12}")
 
-    for slot in quiet_slots:
+    for slot in QUIET_SLOTS:
         hex_val = colors[slot]
         L, C, h = hex_to_oklch(hex_val)
         sw = swatch(hex_val, 6)
         hn = hue_name(h)
         print(f"  {slot:<8} {hex_val:<10} {sw} {L:>6.3f} {C:>7.4f} {h:>6.1f}°  {hn}")
 
+# Pair assessments: the common all-clear case is one pre-colored constant
+PAIR_GOOD = f"{rgb_fg('#04b372')}Good{reset()}"
+PAIR_ISSUE_FG = rgb_fg("#d9048e")
+
 def analyze_pairs(colors: dict[str, str]):
     print_header("LOUD vs QUIET PAIR ANALYSIS")
 
-    pairs = [
-        ('base08', 'base10', 'red/pink'),
-        ('base09', 'base11', 'orange'),
-        ('base0A', 'base12', 'yellow'),
-        ('base0B', 'base13', 'green'),
-        ('base0C', 'base14', 'cyan'),
-        ('base0D', 'base15', 'blue'),
-        ('base0E', 'base16', 'purple'),
-        ('base0F', 'base17', 'lime'),
-    ]
-
     print_subheader("Side-by-Side Comparison")
     print(f"  {'Color':<10} {'Loud':<10} {'Quiet':<10} {'Swatches':<16}")
     print(f"  {'─'*10} {'─'*10} {'─'*10} {'─'*16}")
 
-    for loud, quiet, name in pairs:
+    for (loud, quiet), name in zip(PAIRS, PAIR_NAMES):
         loud_sw = swatch(colors[loud], 6)
         quiet_sw = swatch(colors[quiet], 6)
         print(f"  {name:<10} {colors[loud]:<10} {colors[quiet]:<10} {loud_sw} → {quiet_sw}")
@@ -294,7 +296,7 @@ def analyze_pairs(colors: dict[str, str]):
     print(f"  {'Color':<10} {'ΔL':>8} {'ΔC':>8} {'Δh':>8}  Assessment")
     print(f"  {'─'*10} {'─'*8} {'─'*8} {'─'*8}  {'─'*30}")
 
-    for loud, quiet, name in pairs:
+    for (loud, quiet), name in zip(PAIRS, PAIR_NAMES):
         L1, C1, h1 = hex_to_oklch(colors[loud])
         L2, C2, h2 = hex_to_oklch(colors[quiet])
 
@@ -304,24 +306,41 @@ def analyze_pairs(colors: dict[str, str]):
         if dh > 180: dh -= 360
         if dh < -180: dh += 360
 
-        issues = []
-        if dL < 0:
-            issues.append("darker (unusual)")
-        if dC > -0.03:
-            issues.append("low chroma reduction")
-        if abs(dh) > 10:
-            issues.append(f"hue drift")
-
-        assessment = ", ".join(issues) if issues else "Good"
-        color = "#d9048e" if issues else "#04b372"
+        if dL >= 0 and dC <= -0.03 and abs(dh) <= 10:
+            assessment = PAIR_GOOD
+        else:
+            issues = []
+            if dL < 0:
+                issues.append("darker (unusual)")
+            if dC > -0.03:
+                issues.append("low chroma reduction")
+            if abs(dh) > 10:
+                issues.append("hue drift")
+            assessment = f"{PAIR_ISSUE_FG}{', '.join(issues)}{reset()}"
 
-        print(f"  {name:<10} {dL:>+8.4f} {dC:>+8.4f} {dh:>+8.1f}° {rgb_fg(color)}{assessment}{reset()}")
+        print(f"  {name:<10} {dL:>+8.4f} {dC:>+8.4f} {dh:>+8.1f}° {assessment}")
 
     print_subheader("Ideal Quieting Formula")
     print("  Target: ΔL ≈ +0.02 to +0.05 (slightly lighter)")
     print("          ΔC ≈ -0.05 to -0.10 (less saturated)")
     print("          Δh ≈ 0° (preserve hue identity)")
 
+# WCAG contrast classes: bisect_right(limits, ratio) indexes the label, so a
+# ratio exactly on a limit falls into the class above it (ratio >= limit)
+TEXT_CONTRAST_LIMITS = (3, 4.5, 7)
+TEXT_CONTRAST_LABELS = tuple(f"{rgb_fg(color)}{label}{reset()}" for label, color in (
+    ("Fails", "#d9048e"),
+    ("AA Large only", "#f2a633"),
+    ("AA (good)", "#04b372"),
+    ("AAA (excellent)", "#04b372"),
+))
+ACCENT_CONTRAST_LIMITS = (3, 4.5)
+ACCENT_CONTRAST_LABELS = tuple(f"{rgb_fg(color)}{label}{reset()}" for label, color in (
+    ("Low", "#d9048e"),
+    ("Large", "#f2a633"),
+    ("AA", "#04b372"),
+))
+
 def analyze_contrast(colors: dict[str, str]):
     print_header("CONTRAST ANALYSIS")
 
@@ -331,57 +350,30 @@ def analyze_contrast(colors: dict[str, str]):
     print(f"  {'Color':<10} {'Hex':<10} {'Swatch':<8} {'Ratio':>7}  WCAG")
     print(f"  {'─'*10} {'─'*10} {'─'*8} {'─'*7}  {'─'*20}")
 
-    text_slots = ['base03', 'base04', 'base05', 'base06', 'base07']
-    for slot in text_slots:
+    for slot in GRAY_SLOTS[3:]:  # base03-07: text shades
         hex_val = colors[slot]
         ratio = contrast_ratio(hex_val, bg)
         sw = swatch(hex_val, 6)
-
-        if ratio >= 7:
-            wcag = "AAA (excellent)"
-            color = "#04b372"
-        elif ratio >= 4.5:
-            wcag = "AA (good)"
-            color = "#04b372"
-        elif ratio >= 3:
-            wcag = "AA Large only"
-            color = "#f2a633"
-        else:
-            wcag = "Fails"
-            color = "#d9048e"
-
+        wcag = TEXT_CONTRAST_LABELS[bisect.bisect_right(TEXT_CONTRAST_LIMITS, ratio)]
         role = ROLES.get(slot, '')
-        print(f"  {slot:<10} {hex_val:<10} {sw} {ratio:>7.2f}  {rgb_fg(color)}{wcag}{reset()} ({role})")
+        print(f"  {slot:<10} {hex_val:<10} {sw} {ratio:>7.2f}  {wcag} ({role})")
 
     print_subheader("Accent Colors on Background")
-    accent_slots = ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F']
-    for slot in accent_slots:
+    for slot in LOUD_SLOTS:
         hex_val = colors[slot]
         ratio = contrast_ratio(hex_val, bg)
         sw = swatch(hex_val, 6)
-
-        if ratio >= 4.5:
-            wcag = "AA"
-            color = "#04b372"
-        elif ratio >= 3:
-            wcag = "Large"
-            color = "#f2a633"
-        else:
-            wcag = "Low"
-            color = "#d9048e"
-
-        print(f"  {slot:<10} {hex_val:<10} {sw} {ratio:>7.2f}  {rgb_fg(color)}{wcag}{reset()}")
+        wcag = ACCENT_CONTRAST_LABELS[bisect.bisect_right(ACCENT_CONTRAST_LIMITS, ratio)]
+        print(f"  {slot:<10} {hex_val:<10} {sw} {ratio:>7.2f}  {wcag}")
 
 def analyze_hue_wheel(colors: dict[str, str]):
     print_header("HUE DISTRIBUTION")
 
-    accents = ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F']
-
     print_subheader("Hue Positions (0-360°)")
 
     # Sort by hue
     hue_data = []
-    for slot in accents:
+    for slot in LOUD_SLOTS:
         L, C, h = hex_to_oklch(colors[slot])
         hue_data.append((h, slot, colors[slot], C))
 
@@ -422,41 +414,36 @@ def show_palette_visual(colors: dict[str, str]):
 
     print_subheader("Grayscale")
     print("  ", end="")
-    for i in range(8):
-        slot = f"base0{i}"
+    for slot in GRAY_SLOTS:
         print(labeled_swatch(colors[slot], 10), end="")
     print()
     print("  ", end="")
-    for i in range(8):
-        print(f"{'base0' + str(i):^10}", end="")
+    for slot in GRAY_SLOTS:
+        print(f"{slot:^10}", end="")
     print()
 
     print_subheader("Loud Accents")
     print("  ", end="")
-    for slot in ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F']:
+    for slot in LOUD_SLOTS:
         print(labeled_swatch(colors[slot], 10), end="")
     print()
     print("  ", end="")
-    for slot in ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F']:
+    for slot in LOUD_SLOTS:
         print(f"{slot:^10}", end="")
     print()
 
     print_subheader("Quiet Accents")
     print("  ", end="")
-    for slot in ['base10', 'base11', 'base12', 'base13', 'base14', 'base15', 'base16', 'base17']:
+    for slot in QUIET_SLOTS:
         print(labeled_swatch(colors[slot], 10), end="")
     print()
     print("  ", end="")
-    for slot in ['base10', 'base11', 'base12', 'base13', 'base14', 'base15', 'base16', 'base17']:
+    for slot in QUIET_SLOTS:
         print(f"{slot:^10}", end="")
     print()
 
     print_subheader("Loud → Quiet Pairs")
-    pairs = [
-        ('base08', 'base10'), ('base09', 'base11'), ('base0A', 'base12'), ('base0B', 'base13'),
-        ('base0C', 'base14'), ('base0D', 'base15'), ('base0E', 'base16'), ('base0F', 'base17'),
-    ]
-    for loud, quiet in pairs:
+    for loud, quiet in PAIRS:
         loud_sw = swatch(colors[loud], 8)
         quiet_sw = swatch(colors[quiet], 8)
         print(f"  {loud_sw} → {quiet_sw}  {loud} → {quiet}")
@@ -468,8 +455,7 @@ def suggest_grayscale(colors: dict[str, str]):
 
     # Current values
     current = []
-    for i in range(8):
-        slot = f"base0{i}"
+    for slot in GRAY_SLOTS:
         L, C, h = hex_to_oklch(colors[slot])
         current.append((slot, colors[slot], L, C, h))
 
@@ -553,4 +539,10 @@ def main():
     print()
 
 if __name__ == "__main__":
+    # The report is several hundred short lines; on a TTY stdout would
+    # otherwise issue a write per line. Block-buffer it so it goes out in
+    # a few large writes instead. Only when run as a script, and only if
+    # stdout is a real text stream (not a capture object).
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
     main()
@@ -4,14 +4,24 @@ Human++ Build Script
 
 Generates all theme files from palette.toml (the single source of truth).
 
-Usage: python3 tools/build.py
+Usage: python3 tools/build.py [--quiet]
 """
 
-import re
 import os
+import sys
 import json
+import functools
+import subprocess
+from datetime import datetime, timezone
+from typing import NamedTuple
 from pathlib import Path
 
+# Shared palette reader; importable both as a script and as tools.build
+if __package__:
+    from .lib.palette import load_palette
+else:
+    from lib.palette import load_palette
+
 # Directory structure
 ROOT = Path(__file__).parent.parent  # repo root (parent of tools/)
 TOOLS = ROOT / "tools"
@@ -20,56 +30,126 @@ SITE = ROOT / "site"
 PACKAGES = ROOT / "packages"
 TINTY_DATA = Path.home() / ".local/share/tinted-theming/tinty"
 
+# Channel byte -> 0.0-1.0 float, precomputed for all 256 values
+BYTE_TO_DEC = tuple(i / 255.0 for i in range(256))
+
 
 def parse_palette():
     """Parse palette.toml and return color dict."""
-    palette_path = ROOT / "palette.toml"
-    content = palette_path.read_text()
+    return load_palette(ROOT / "palette.toml")
 
-    colors = {}
-    meta = {}
 
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#') or line.startswith('['):
-            continue
+class Components(NamedTuple):
+    """A single color in the formats templates need."""
+    hex: str        # 'rrggbb' (no hash)
+    hex_r: str
+    hex_g: str
+    hex_b: str
+    rgb_r: int      # 0-255
+    rgb_g: int
+    rgb_b: int
+    dec_r: float    # 0.0-1.0
+    dec_g: float
+    dec_b: float
 
-        if '=' in line:
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
 
-            # Remove quotes first
-            if value.startswith('"') and '"' in value[1:]:
-                value = value[1:value.index('"', 1)]
-            elif value.startswith("'") and "'" in value[1:]:
-                value = value[1:value.index("'", 1)]
+@functools.lru_cache(maxsize=None)
+def hex_to_components(hex_color):
+    """Convert #rrggbb to various formats.
 
-            if key in ['name', 'author', 'description']:
-                meta[key] = value
-            elif key.startswith('base') and value.startswith('#'):
-                colors[key] = value
+    Results are cached per hex string and shared between callers, which
+    is safe because Components is immutable.
+    """
+    hex_color = hex_color.lstrip('#')
+    r, g, b = bytes.fromhex(hex_color)
+    return Components(
+        hex=hex_color,
+        hex_r=hex_color[0:2],
+        hex_g=hex_color[2:4],
+        hex_b=hex_color[4:6],
+        rgb_r=r,
+        rgb_g=g,
+        rgb_b=b,
+        dec_r=BYTE_TO_DEC[r],
+        dec_g=BYTE_TO_DEC[g],
+        dec_b=BYTE_TO_DEC[b],
+    )
 
-    return colors, meta
 
+def palette_components(colors):
+    """Convert every palette color at once: {slot: hex_to_components(hex)}."""
+    return {slot: hex_to_components(value) for slot, value in colors.items()}
 
-def hex_to_components(hex_color):
-    """Convert #rrggbb to various formats."""
-    hex_color = hex_color.lstrip('#')
-    return {
-        'hex': hex_color,
-        'hex_hash': f'#{hex_color}',
-        'hex_r': hex_color[0:2],
-        'hex_g': hex_color[2:4],
-        'hex_b': hex_color[4:6],
-        'rgb_r': int(hex_color[0:2], 16),
-        'rgb_g': int(hex_color[2:4], 16),
-        'rgb_b': int(hex_color[4:6], 16),
-        'dec_r': int(hex_color[0:2], 16) / 255.0,
-        'dec_g': int(hex_color[2:4], 16) / 255.0,
-        'dec_b': int(hex_color[4:6], 16) / 255.0,
-        'argb': f'0xff{hex_color}',
-    }
+
+def palette_hex(colors):
+    """Flatten the palette to {slot: 'rrggbb'} for one-lookup templating."""
+    return {slot: comps.hex for slot, comps in palette_components(colors).items()}
+
+
+def hex_to_argb(hex_color):
+    """Convert #rrggbb to opaque 0xffrrggbb without parsing the channels."""
+    return '0xff' + hex_color[1:]
+
+
+def palette_argb(colors):
+    """Flatten the palette to {slot: '0xffrrggbb'} for one-lookup templating."""
+    return {slot: hex_to_argb(value) for slot, value in colors.items()}
+
+
+def write_output(path, content):
+    """Write a generated file, leaving it untouched if nothing changed.
+
+    Skipping identical rewrites keeps mtimes stable, so file watchers
+    (ghostty, sketchybar, bat cache) only reload when the theme changes.
+    New content goes to a sibling .tmp file that is renamed into place,
+    so an interrupted build never leaves a half-written theme behind.
+    Symlinked outputs are written through to their target, as write_text
+    did, rather than being replaced by a regular file.
+    Returns True if the file was written.
+    """
+    data = content.encode('utf-8')
+    path = path.resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+# Set by main() from --quiet; silences progress lines but not warnings
+QUIET = False
+
+
+def log(message=''):
+    """Print a build progress line unless running with --quiet."""
+    if not QUIET:
+        print(message)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_template(path, mtime_ns):
+    return path.read_text()
+
+
+def load_template(path):
+    """Read a template file, reusing the cached text until its mtime changes."""
+    return _read_template(path, path.stat().st_mtime_ns)
+
+
+def render_slots(content, colors):
+    """Replace each {{baseXX}} placeholder with that slot's lowercase hex."""
+    for slot, hex_value in colors.items():
+        content = content.replace('{{' + slot + '}}', hex_value.lower())
+    return content
 
 
 # =============================================================================
@@ -78,211 +158,230 @@ def hex_to_components(hex_color):
 
 def generate_ghostty(colors, meta):
     """Generate ghostty/config."""
-    c = {k: hex_to_components(v) for k, v in colors.items()}
+    hex_of = palette_hex(colors)
 
     content = f"""# Human++ - Base24
 # Generated from palette.toml
 
-background = {c['base00']['hex']}
-foreground = {c['base07']['hex']}
-cursor-color = {c['base07']['hex']}
-selection-background = {c['base02']['hex']}
-selection-foreground = {c['base05']['hex']}
+background = {hex_of['base00']}
+foreground = {hex_of['base07']}
+cursor-color = {hex_of['base07']}
+selection-background = {hex_of['base02']}
+selection-foreground = {hex_of['base05']}
 
 # Normal colors (LOUD accents)
-palette = 0=#{c['base00']['hex']}
-palette = 1=#{c['base08']['hex']}
-palette = 2=#{c['base0B']['hex']}
-palette = 3=#{c['base0A']['hex']}
-palette = 4=#{c['base0D']['hex']}
-palette = 5=#{c['base0E']['hex']}
-palette = 6=#{c['base0C']['hex']}
-palette = 7=#{c['base06']['hex']}
+palette = 0=#{hex_of['base00']}
+palette = 1=#{hex_of['base08']}
+palette = 2=#{hex_of['base0B']}
+palette = 3=#{hex_of['base0A']}
+palette = 4=#{hex_of['base0D']}
+palette = 5=#{hex_of['base0E']}
+palette = 6=#{hex_of['base0C']}
+palette = 7=#{hex_of['base06']}
 
 # Bright colors (QUIET accents)
-palette = 8=#{c['base03']['hex']}
-palette = 9=#{c['base10']['hex']}
-palette = 10=#{c['base13']['hex']}
-palette = 11=#{c['base12']['hex']}
-palette = 12=#{c['base15']['hex']}
-palette = 13=#{c['base16']['hex']}
-palette = 14=#{c['base14']['hex']}
-palette = 15=#{c['base07']['hex']}
+palette = 8=#{hex_of['base03']}
+palette = 9=#{hex_of['base10']}
+palette = 10=#{hex_of['base13']}
+palette = 11=#{hex_of['base12']}
+palette = 12=#{hex_of['base15']}
+palette = 13=#{hex_of['base16']}
+palette = 14=#{hex_of['base14']}
+palette = 15=#{hex_of['base07']}
 """
 
-    (DIST / "ghostty").mkdir(parents=True, exist_ok=True)
-    (DIST / "ghostty/config").write_text(content)
-    print("  ✓ dist/ghostty/config")
+    write_output(DIST / "ghostty/config", content)
+    log("  ✓ dist/ghostty/config")
+
+
+# (mode, slot, note) for each skhd mode, shared by sketchybar's MODE_*
+# and skhd's SKHD_MODE_* exports
+MODE_COLORS = (
+    ('DEFAULT', 'base08', 'hot pink'),
+    ('SWITCHER', 'base0B', 'green'),
+    ('SWAP', 'base0C', 'cyan'),
+    ('TREE', 'base0A', 'amber'),
+    ('LAYOUT', 'base0E', 'purple'),
+    ('MEET', 'base09', 'orange'),
+)
+
+# (section header, [(variable, slot, note)]) in colors.sh order.
+# A slot of None marks a fixed value that is not part of the palette.
+SKETCHYBAR_EXPORTS = (
+    ('Base grayscale (cool)', (
+        ('COLOR_BG', 'base00', 'background'),
+        ('COLOR_BG_LIGHT', 'base01', 'elevation'),
+        ('COLOR_BG_ALT', 'base02', 'selection/panels'),
+        ('COLOR_FG', 'base05', 'main text'),
+        ('COLOR_FG_DIM', 'base03', 'comments'),
+        ('COLOR_FG_SECONDARY', 'base04', 'UI secondary'),
+        ('COLOR_TRANSPARENT', None, None),
+    )),
+    ('Loud accents (diagnostics, signals)', (
+        ('COLOR_RED', 'base08', 'errors, attention'),
+        ('COLOR_ORANGE', 'base09', 'warnings'),
+        ('COLOR_YELLOW', 'base0A', 'caution'),
+        ('COLOR_GREEN', 'base0B', 'success'),
+        ('COLOR_CYAN', 'base0C', 'info'),
+        ('COLOR_BLUE', 'base0D', 'links, focus'),
+        ('COLOR_PURPLE', 'base0E', 'special'),
+        ('COLOR_HUMAN', 'base0F', 'human intent marker'),
+    )),
+    ('Quiet accents (UI state, less urgent)', (
+        ('COLOR_RED_QUIET', 'base10', None),
+        ('COLOR_ORANGE_QUIET', 'base11', None),
+        ('COLOR_YELLOW_QUIET', 'base12', None),
+        ('COLOR_GREEN_QUIET', 'base13', None),
+        ('COLOR_CYAN_QUIET', 'base14', None),
+        ('COLOR_BLUE_QUIET', 'base15', None),
+        ('COLOR_PURPLE_QUIET', 'base16', None),
+    )),
+    ('Mode colors (using loud accents for visibility)', tuple(
+        (f'MODE_{mode}', slot, note) for mode, slot, note in MODE_COLORS
+    )),
+)
 
 
 def generate_sketchybar(colors, meta):
     """Generate sketchybar/colors.sh."""
-    c = {k: hex_to_components(v) for k, v in colors.items()}
-
-    content = f"""#!/bin/bash
-# Human++ - Base24
-# Generated from palette.toml
-
-# Base grayscale (cool)
-export COLOR_BG={c['base00']['argb']}           # base00 - background
-export COLOR_BG_LIGHT={c['base01']['argb']}     # base01 - elevation
-export COLOR_BG_ALT={c['base02']['argb']}       # base02 - selection/panels
-export COLOR_FG={c['base05']['argb']}           # base05 - main text
-export COLOR_FG_DIM={c['base03']['argb']}       # base03 - comments
-export COLOR_FG_SECONDARY={c['base04']['argb']} # base04 - UI secondary
-export COLOR_TRANSPARENT=0x00000000
-
-# Loud accents (diagnostics, signals)
-export COLOR_RED={c['base08']['argb']}          # base08 - errors, attention
-export COLOR_ORANGE={c['base09']['argb']}       # base09 - warnings
-export COLOR_YELLOW={c['base0A']['argb']}       # base0A - caution
-export COLOR_GREEN={c['base0B']['argb']}        # base0B - success
-export COLOR_CYAN={c['base0C']['argb']}         # base0C - info
-export COLOR_BLUE={c['base0D']['argb']}         # base0D - links, focus
-export COLOR_PURPLE={c['base0E']['argb']}       # base0E - special
-export COLOR_HUMAN={c['base0F']['argb']}        # base0F - human intent marker
-
-# Quiet accents (UI state, less urgent)
-export COLOR_RED_QUIET={c['base10']['argb']}    # base10
-export COLOR_ORANGE_QUIET={c['base11']['argb']} # base11
-export COLOR_YELLOW_QUIET={c['base12']['argb']} # base12
-export COLOR_GREEN_QUIET={c['base13']['argb']}  # base13
-export COLOR_CYAN_QUIET={c['base14']['argb']}   # base14
-export COLOR_BLUE_QUIET={c['base15']['argb']}   # base15
-export COLOR_PURPLE_QUIET={c['base16']['argb']} # base16
-
-# Mode colors (using loud accents for visibility)
-export MODE_DEFAULT={c['base08']['argb']}       # base08 - hot pink
-export MODE_SWITCHER={c['base0B']['argb']}      # base0B - green
-export MODE_SWAP={c['base0C']['argb']}          # base0C - cyan
-export MODE_TREE={c['base0A']['argb']}          # base0A - amber
-export MODE_LAYOUT={c['base0E']['argb']}        # base0E - purple
-export MODE_MEET={c['base09']['argb']}          # base09 - orange
-"""
+    argb_of = palette_argb(colors)
 
-    (DIST / "sketchybar").mkdir(parents=True, exist_ok=True)
-    (DIST / "sketchybar/colors.sh").write_text(content)
-    print("  ✓ dist/sketchybar/colors.sh")
+    lines = [
+        "#!/bin/bash",
+        "# Human++ - Base24",
+        "# Generated from palette.toml",
+    ]
+    for header, exports in SKETCHYBAR_EXPORTS:
+        lines.append("")
+        lines.append(f"# {header}")
+        for name, slot, note in exports:
+            if slot is None:
+                lines.append(f"export {name}=0x00000000")
+                continue
+            export = f"export {name}={argb_of[slot]}".ljust(36)
+            comment = f"{slot} - {note}" if note else slot
+            lines.append(f"{export} # {comment}")
+    content = "\n".join(lines) + "\n"
+
+    write_output(DIST / "sketchybar/colors.sh", content)
+    log("  ✓ dist/sketchybar/colors.sh")
 
 
 def generate_borders(colors, meta):
     """Generate borders/bordersrc."""
-    c = {k: hex_to_components(v) for k, v in colors.items()}
+    argb_of = palette_argb(colors)
 
     content = f"""#!/bin/bash
 # Human++ - borders config
 # Generated from palette.toml
 
-borders active_color={c['base08']['argb']} \\
+borders active_color={argb_of['base08']} \\
         inactive_color=0x00000000 \\
         width=8.0 \\
         style=square \\
         hidpi=on
 """
 
-    (DIST / "borders").mkdir(parents=True, exist_ok=True)
-    (DIST / "borders/bordersrc").write_text(content)
-    print("  ✓ dist/borders/bordersrc")
+    write_output(DIST / "borders/bordersrc", content)
+    log("  ✓ dist/borders/bordersrc")
 
 
 def generate_skhd(colors, meta):
     """Generate skhd/modes.sh."""
-    c = {k: hex_to_components(v) for k, v in colors.items()}
+    argb_of = palette_argb(colors)
 
-    content = f"""#!/bin/bash
-# Human++ - skhd mode colors
-# Generated from palette.toml
-
-export SKHD_MODE_DEFAULT={c['base08']['argb']}    # base08 - hot pink
-export SKHD_MODE_SWITCHER={c['base0B']['argb']}   # base0B - green
-export SKHD_MODE_SWAP={c['base0C']['argb']}       # base0C - cyan
-export SKHD_MODE_TREE={c['base0A']['argb']}       # base0A - amber
-export SKHD_MODE_LAYOUT={c['base0E']['argb']}     # base0E - purple
-export SKHD_MODE_MEET={c['base09']['argb']}       # base09 - orange
-"""
+    lines = [
+        "#!/bin/bash",
+        "# Human++ - skhd mode colors",
+        "# Generated from palette.toml",
+        "",
+    ]
+    for mode, slot, note in MODE_COLORS:
+        export = f"export SKHD_MODE_{mode}={argb_of[slot]}".ljust(38)
+        lines.append(f"{export} # {slot} - {note}")
+    content = "\n".join(lines) + "\n"
 
-    (DIST / "skhd").mkdir(parents=True, exist_ok=True)
-    (DIST / "skhd/modes.sh").write_text(content)
-    print("  ✓ dist/skhd/modes.sh")
+    write_output(DIST / "skhd/modes.sh", content)
+    log("  ✓ dist/skhd/modes.sh")
 
 
+@functools.lru_cache(maxsize=None)
 def hex_to_ansi256(hex_color):
     """Convert hex color to ANSI 256 escape code format (38;2;r;g;b for true color)."""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
     return f"38;2;{r};{g};{b}"
 
 
 def hex_to_ansi_bg_fg(bg_hex, fg_hex):
     """Convert hex colors to ANSI bg+fg format (48;2;r;g;b;38;2;r;g;b)."""
-    bg = bg_hex.lstrip('#')
-    fg = fg_hex.lstrip('#')
-    bg_r, bg_g, bg_b = int(bg[0:2], 16), int(bg[2:4], 16), int(bg[4:6], 16)
-    fg_r, fg_g, fg_b = int(fg[0:2], 16), int(fg[2:4], 16), int(fg[4:6], 16)
+    bg_r, bg_g, bg_b = bytes.fromhex(bg_hex.lstrip('#'))
+    fg_r, fg_g, fg_b = bytes.fromhex(fg_hex.lstrip('#'))
     return f"48;2;{bg_r};{bg_g};{bg_b};38;2;{fg_r};{fg_g};{fg_b}"
 
 
+# EZA_COLORS (code, slot, extra SGR) - terminal = high signal, use LOUD palette
+# Two-letter codes: https://github.com/eza-community/eza/blob/main/man/eza_colors.5.md
+EZA_CODES = (
+    # Filetypes - LOUD colors, this is what you're looking at
+    ('di', 'base0D', ''),      # directories - LOUD blue
+    ('ln', 'base0C', ''),      # symlinks - LOUD cyan
+    ('ex', 'base0B', ''),      # executables - LOUD green
+    ('fi', 'base07', ''),      # regular files - brightest white
+    ('pi', 'base0A', ''),      # pipes - LOUD amber
+    ('so', 'base0E', ''),      # sockets - LOUD purple
+    ('bd', 'base09', ''),      # block devices - LOUD orange
+    ('cd', 'base09', ''),      # char devices - LOUD orange
+    ('or', 'base08', ''),      # orphan symlinks - LOUD pink
+    ('mi', 'base08', ''),      # missing files - LOUD pink
+    # Permissions - LOUD for important, dim for less important
+    ('ur', 'base0A', ''),      # user read - LOUD amber
+    ('uw', 'base08', ''),      # user write - LOUD pink
+    ('ux', 'base0B', ''),      # user exec - LOUD green
+    ('ue', 'base0B', ''),      # user exec (other) - LOUD green
+    ('gr', 'base04', ''),      # group read - secondary
+    ('gw', 'base09', ''),      # group write - LOUD orange
+    ('gx', 'base0B', ''),      # group exec - LOUD green
+    ('tr', 'base03', ''),      # other read - dim
+    ('tw', 'base08', ''),      # other write - LOUD pink (dangerous!)
+    ('tx', 'base03', ''),      # other exec - dim
+    # Hard links count (the number before file size)
+    ('lc', 'base16', ''),      # link count - quiet purple
+    # Size - quiet, not that important
+    ('sn', 'base17', ''),      # size numbers - quiet lime
+    ('sb', 'base03', ''),      # size unit - dim
+    # User/group - grayscale, it's just metadata
+    ('uu', 'base04', ''),      # current user - secondary
+    ('un', 'base03', ''),      # other user - dim
+    ('gu', 'base03', ''),      # current group - dim
+    ('gn', 'base03', ''),      # other group - dim
+    # Git - LOUD, git status is important
+    ('ga', 'base0B', ''),      # git new - LOUD green
+    ('gm', 'base0A', ''),      # git modified - LOUD amber
+    ('gd', 'base08', ''),      # git deleted - LOUD pink
+    ('gv', 'base0C', ''),      # git renamed - LOUD cyan
+    ('gt', 'base03', ''),      # git ignored - dim
+    # Misc
+    ('da', 'base03', ''),      # date - dim (not important)
+    ('hd', 'base07', ';1'),    # header - brightest + bold
+    ('xx', 'base03', ''),      # punctuation - dim
+)
+
+
 def generate_eza(colors, meta):
     """Generate eza/colors.sh with EZA_COLORS environment variable.
 
     Terminal philosophy: output is intentional, use LOUD colors.
     """
     c = colors
-
-    # Build EZA_COLORS string using true color (38;2;r;g;b format)
-    # Two-letter codes: https://github.com/eza-community/eza/blob/main/man/eza_colors.5.md
-    # Terminal = high signal, use LOUD palette
-    eza_parts = [
-        # Filetypes - LOUD colors, this is what you're looking at
-        f"di={hex_to_ansi256(c['base0D'])}",        # directories - LOUD blue
-        f"ln={hex_to_ansi256(c['base0C'])}",        # symlinks - LOUD cyan
-        f"ex={hex_to_ansi256(c['base0B'])}",        # executables - LOUD green
-        f"fi={hex_to_ansi256(c['base07'])}",        # regular files - brightest white
-        f"pi={hex_to_ansi256(c['base0A'])}",        # pipes - LOUD amber
-        f"so={hex_to_ansi256(c['base0E'])}",        # sockets - LOUD purple
-        f"bd={hex_to_ansi256(c['base09'])}",        # block devices - LOUD orange
-        f"cd={hex_to_ansi256(c['base09'])}",        # char devices - LOUD orange
-        f"or={hex_to_ansi256(c['base08'])}",        # orphan symlinks - LOUD pink
-        f"mi={hex_to_ansi256(c['base08'])}",        # missing files - LOUD pink
-        # Permissions - LOUD for important, dim for less important
-        f"ur={hex_to_ansi256(c['base0A'])}",        # user read - LOUD amber
-        f"uw={hex_to_ansi256(c['base08'])}",        # user write - LOUD pink
-        f"ux={hex_to_ansi256(c['base0B'])}",        # user exec - LOUD green
-        f"ue={hex_to_ansi256(c['base0B'])}",        # user exec (other) - LOUD green
-        f"gr={hex_to_ansi256(c['base04'])}",        # group read - secondary
-        f"gw={hex_to_ansi256(c['base09'])}",        # group write - LOUD orange
-        f"gx={hex_to_ansi256(c['base0B'])}",        # group exec - LOUD green
-        f"tr={hex_to_ansi256(c['base03'])}",        # other read - dim
-        f"tw={hex_to_ansi256(c['base08'])}",        # other write - LOUD pink (dangerous!)
-        f"tx={hex_to_ansi256(c['base03'])}",        # other exec - dim
-        # Hard links count (the number before file size)
-        f"lc={hex_to_ansi256(c['base16'])}",        # link count - quiet purple
-        # Size - quiet, not that important
-        f"sn={hex_to_ansi256(c['base17'])}",        # size numbers - quiet lime
-        f"sb={hex_to_ansi256(c['base03'])}",        # size unit - dim
-        # User/group - grayscale, it's just metadata
-        f"uu={hex_to_ansi256(c['base04'])}",        # current user - secondary
-        f"un={hex_to_ansi256(c['base03'])}",        # other user - dim
-        f"gu={hex_to_ansi256(c['base03'])}",        # current group - dim
-        f"gn={hex_to_ansi256(c['base03'])}",        # other group - dim
-        # Git - LOUD, git status is important
-        f"ga={hex_to_ansi256(c['base0B'])}",        # git new - LOUD green
-        f"gm={hex_to_ansi256(c['base0A'])}",        # git modified - LOUD amber
-        f"gd={hex_to_ansi256(c['base08'])}",        # git deleted - LOUD pink
-        f"gv={hex_to_ansi256(c['base0C'])}",        # git renamed - LOUD cyan
-        f"gt={hex_to_ansi256(c['base03'])}",        # git ignored - dim
-        # Misc
-        f"da={hex_to_ansi256(c['base03'])}",        # date - dim (not important)
-        f"hd={hex_to_ansi256(c['base07'])};1",      # header - brightest + bold
-        f"xx={hex_to_ansi256(c['base03'])}",        # punctuation - dim
-        # Special files - !! badge style (lime bg, dark text for contrast)
-        f"README*={hex_to_ansi_bg_fg(c['base0F'], c['base00'])}",
-        f"README.md={hex_to_ansi_bg_fg(c['base0F'], c['base00'])}",
-    ]
-
-    eza_colors = ":".join(eza_parts)
+    ansi = {slot: hex_to_ansi256(value) for slot, value in colors.items()}
+
+    # Special files - !! badge style (lime bg, dark text for contrast)
+    badge = hex_to_ansi_bg_fg(c['base0F'], c['base00'])
+    eza_colors = ":".join([
+        *(f"{code}={ansi[slot]}{extra}" for code, slot, extra in EZA_CODES),
+        f"README*={badge}",
+        f"README.md={badge}",
+    ])
 
     content = f'''#!/bin/bash
 # Human++ - eza colors
@@ -292,9 +391,30 @@ def generate_eza(colors, meta):
 export EZA_COLORS="{eza_colors}"
 '''
 
-    (DIST / "eza").mkdir(parents=True, exist_ok=True)
-    (DIST / "eza/colors.sh").write_text(content)
-    print("  ✓ dist/eza/colors.sh")
+    write_output(DIST / "eza/colors.sh", content)
+    log("  ✓ dist/eza/colors.sh")
+
+
+# fzf --color (key, slot); None inherits the terminal's own color (-1)
+FZF_COLORS = (
+    ('bg', None),              # background - inherit terminal
+    ('bg+', 'base02'),         # selected background - more contrast
+    ('fg', 'base07'),          # foreground - brightest
+    ('fg+', 'base07'),         # selected foreground - brightest
+    ('hl', 'base0F'),          # highlighted match - LOUD lime (human marker!)
+    ('hl+', 'base0F'),         # selected highlighted - LOUD lime
+    ('info', 'base0C'),        # info line - LOUD cyan
+    ('marker', 'base0B'),      # marker - LOUD green
+    ('prompt', 'base08'),      # prompt - LOUD pink
+    ('spinner', 'base0A'),     # spinner - LOUD amber
+    ('pointer', 'base08'),     # pointer - LOUD pink
+    ('header', 'base07'),      # header - brightest
+    ('border', 'base0D'),      # border - LOUD blue
+    ('gutter', None),          # gutter - inherit terminal
+    ('query', 'base07'),       # query text - brightest
+    ('scrollbar', 'base03'),   # scrollbar - dim
+    ('separator', 'base02'),   # separator line - subtle
+)
 
 
 def generate_fzf(colors, meta):
@@ -307,25 +427,9 @@ def generate_fzf(colors, meta):
     # fzf uses hex colors directly with --color flag
     # Format: --color=KEY:VALUE where VALUE is #rrggbb
     # Use LOUD colors - fzf is interactive, high signal
-    fzf_colors = ",".join([
-        "bg:-1",                         # background - inherit terminal
-        f"bg+:{c['base02']}",            # selected background - more contrast
-        f"fg:{c['base07']}",             # foreground - brightest
-        f"fg+:{c['base07']}",            # selected foreground - brightest
-        f"hl:{c['base0F']}",             # highlighted match - LOUD lime (human marker!)
-        f"hl+:{c['base0F']}",            # selected highlighted - LOUD lime
-        f"info:{c['base0C']}",           # info line - LOUD cyan
-        f"marker:{c['base0B']}",         # marker - LOUD green
-        f"prompt:{c['base08']}",         # prompt - LOUD pink
-        f"spinner:{c['base0A']}",        # spinner - LOUD amber
-        f"pointer:{c['base08']}",        # pointer - LOUD pink
-        f"header:{c['base07']}",         # header - brightest
-        f"border:{c['base0D']}",         # border - LOUD blue
-        "gutter:-1",                     # gutter - inherit terminal
-        f"query:{c['base07']}",          # query text - brightest
-        f"scrollbar:{c['base03']}",      # scrollbar - dim
-        f"separator:{c['base02']}",      # separator line - subtle
-    ])
+    fzf_colors = ",".join(
+        f"{key}:{c[slot] if slot else -1}" for key, slot in FZF_COLORS
+    )
 
     content = f'''#!/bin/bash
 # Human++ - fzf colors
@@ -335,9 +439,8 @@ def generate_fzf(colors, meta):
 export FZF_DEFAULT_OPTS="$FZF_DEFAULT_OPTS --color={fzf_colors}"
 '''
 
-    (DIST / "fzf").mkdir(parents=True, exist_ok=True)
-    (DIST / "fzf/colors.sh").write_text(content)
-    print("  ✓ dist/fzf/colors.sh")
+    write_output(DIST / "fzf/colors.sh", content)
+    log("  ✓ dist/fzf/colors.sh")
 
 
 def generate_bat(colors, meta):
@@ -635,10 +738,9 @@ def generate_bat(colors, meta):
 </plist>
 '''
 
-    (DIST / "bat").mkdir(parents=True, exist_ok=True)
-    (DIST / "bat/Human++.tmTheme").write_text(content)
-    print("  ✓ dist/bat/Human++.tmTheme")
-    print("    → Install: mkdir -p ~/.config/bat/themes && cp dist/bat/Human++.tmTheme ~/.config/bat/themes/ && bat cache --build")
+    write_output(DIST / "bat/Human++.tmTheme", content)
+    log("  ✓ dist/bat/Human++.tmTheme")
+    log("    → Install: mkdir -p ~/.config/bat/themes && cp dist/bat/Human++.tmTheme ~/.config/bat/themes/ && bat cache --build")
 
 
 def generate_glow(colors, meta):
@@ -647,7 +749,6 @@ def generate_glow(colors, meta):
     Glow uses glamour JSON styles for markdown rendering.
     """
     c = colors
-    import json
 
     style = {
         "document": {
@@ -789,10 +890,9 @@ def generate_glow(colors, meta):
         "html_span": {}
     }
 
-    (DIST / "glow").mkdir(parents=True, exist_ok=True)
-    (DIST / "glow/human-plus-plus.json").write_text(json.dumps(style, indent=2))
-    print("  ✓ dist/glow/human-plus-plus.json")
-    print("    → Install: glow -s ~/path/to/dist/glow/human-plus-plus.json README.md")
+    write_output(DIST / "glow/human-plus-plus.json", json.dumps(style, indent=2))
+    log("  ✓ dist/glow/human-plus-plus.json")
+    log("    → Install: glow -s ~/path/to/dist/glow/human-plus-plus.json README.md")
 
 
 def generate_delta(colors, meta):
@@ -836,10 +936,9 @@ def generate_delta(colors, meta):
     blame-palette = {c['base00']} {c['base01']} {c['base02']}
 '''
 
-    (DIST / "delta").mkdir(parents=True, exist_ok=True)
-    (DIST / "delta/config.gitconfig").write_text(content)
-    print("  ✓ dist/delta/config.gitconfig")
-    print("    → Install: Add [include] path = ~/path/to/dist/delta/config.gitconfig to ~/.gitconfig")
+    write_output(DIST / "delta/config.gitconfig", content)
+    log("  ✓ dist/delta/config.gitconfig")
+    log("    → Install: Add [include] path = ~/path/to/dist/delta/config.gitconfig to ~/.gitconfig")
 
 
 def generate_git_colors(colors, meta):
@@ -897,9 +996,8 @@ def generate_git_colors(colors, meta):
     tag = {c['base0A']}
 '''
 
-    (DIST / "git").mkdir(parents=True, exist_ok=True)
-    (DIST / "git/colors.gitconfig").write_text(content)
-    print("  ✓ dist/git/colors.gitconfig")
+    write_output(DIST / "git/colors.gitconfig", content)
+    log("  ✓ dist/git/colors.gitconfig")
 
 
 def generate_shell_init(colors, meta):
@@ -949,296 +1047,213 @@ fi
 # fi
 '''
 
-    (DIST / "shell-init.sh").write_text(content)
+    write_output(DIST / "shell-init.sh", content)
     os.chmod(DIST / "shell-init.sh", 0o755)
-    print("  ✓ dist/shell-init.sh")
+    log("  ✓ dist/shell-init.sh")
+
+
+@functools.cache
+def git_output(*args, default):
+    """Run a git command, returning default if it fails.
+
+    Memoized for the life of the process; main() clears the cache so each
+    build it runs sees the current tag and commit.
+    """
+    try:
+        return subprocess.check_output(
+            ['git', *args],
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return default
+
+
+# Human-readable role of each slot, published in site/data/palette.json
+PALETTE_ROLES = {
+    'base00': 'Background',
+    'base01': 'Elevation',
+    'base02': 'Selection',
+    'base03': 'Comments (AI voice)',
+    'base04': 'UI secondary',
+    'base05': 'Main text',
+    'base06': 'Emphasis',
+    'base07': 'Brightest',
+    'base08': 'Errors',
+    'base09': 'Warnings',
+    'base0A': 'Caution',
+    'base0B': 'Success',
+    'base0C': 'Info',
+    'base0D': 'Links',
+    'base0E': 'Special',
+    'base0F': 'Human !!',
+    'base10': 'Keywords',
+    'base11': 'Secondary',
+    'base12': 'Strings',
+    'base13': 'Functions',
+    'base14': 'Types',
+    'base15': 'Hints',
+    'base16': 'Constants',
+    'base17': 'Quiet lime',
+}
+
+# Slot groups as shown on the site and in the palette SVGs
+PALETTE_SLOTS = {
+    'grayscale': ['base00', 'base01', 'base02', 'base03', 'base04', 'base05', 'base06', 'base07'],
+    'loud': ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F'],
+    'quiet': ['base10', 'base11', 'base12', 'base13', 'base14', 'base15', 'base16', 'base17'],
+}
 
 
 def generate_palette_json(colors, meta):
     """Generate site/data/palette.json for the website."""
-    roles = {
-        'base00': 'Background',
-        'base01': 'Elevation',
-        'base02': 'Selection',
-        'base03': 'Comments (AI voice)',
-        'base04': 'UI secondary',
-        'base05': 'Main text',
-        'base06': 'Emphasis',
-        'base07': 'Brightest',
-        'base08': 'Errors',
-        'base09': 'Warnings',
-        'base0A': 'Caution',
-        'base0B': 'Success',
-        'base0C': 'Info',
-        'base0D': 'Links',
-        'base0E': 'Special',
-        'base0F': 'Human !!',
-        'base10': 'Keywords',
-        'base11': 'Secondary',
-        'base12': 'Strings',
-        'base13': 'Functions',
-        'base14': 'Types',
-        'base15': 'Hints',
-        'base16': 'Constants',
-        'base17': 'Quiet lime',
-    }
-
     data = {
         'name': meta.get('name', 'Human++'),
         'author': meta.get('author', 'fielding'),
         'description': meta.get('description', 'A Base24 color scheme for the post-artisanal coding era'),
         'colors': colors,
-        'roles': roles,
-        'slots': {
-            'grayscale': ['base00', 'base01', 'base02', 'base03', 'base04', 'base05', 'base06', 'base07'],
-            'loud': ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F'],
-            'quiet': ['base10', 'base11', 'base12', 'base13', 'base14', 'base15', 'base16', 'base17'],
-        }
+        'roles': PALETTE_ROLES,
+        'slots': PALETTE_SLOTS,
     }
 
     data_dir = SITE / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    (data_dir / "palette.json").write_text(json.dumps(data, indent=2))
-    print("  ✓ site/data/palette.json")
+    write_output(data_dir / "palette.json", json.dumps(data, indent=2))
+    log("  ✓ site/data/palette.json")
 
     # Generate meta.json with version info
-    import subprocess
-    from datetime import datetime, timezone
-
-    try:
-        version = subprocess.check_output(
-            ['git', 'describe', '--tags', '--always'],
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
-    except Exception:
-        version = 'dev'
-
-    try:
-        commit = subprocess.check_output(
-            ['git', 'rev-parse', '--short', 'HEAD'],
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
-    except Exception:
-        commit = 'unknown'
+    version = git_output('describe', '--tags', '--always', default='dev')
+    commit = git_output('rev-parse', '--short', 'HEAD', default='unknown')
 
     meta_data = {
         'name': meta.get('name', 'Human++'),
         'version': version,
         'commit': commit,
+        # Not cached like the git lookups: must be the time of this build
         'built': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
     }
-    (data_dir / "meta.json").write_text(json.dumps(meta_data, indent=2))
-    print("  ✓ site/data/meta.json")
+    write_output(data_dir / "meta.json", json.dumps(meta_data, indent=2))
+    log("  ✓ site/data/meta.json")
 
 
 def generate_site(colors, meta):
     """Generate the static site from templates."""
-    SITE.mkdir(parents=True, exist_ok=True)
-
     # Process the HTML template, substituting color placeholders
     # This ensures fallback CSS variables have real values if palette.json fails to load
     template_path = ROOT / "templates" / "site" / "index.html.tmpl"
     if template_path.exists():
-        content = template_path.read_text()
-
         # Substitute color placeholders with actual values
-        for slot, hex_value in colors.items():
-            placeholder = '{{' + slot + '}}'
-            content = content.replace(placeholder, hex_value.lower())
+        content = render_slots(load_template(template_path), colors)
 
-        (SITE / "index.html").write_text(content)
-        print("  ✓ site/index.html")
+        write_output(SITE / "index.html", content)
+        log("  ✓ site/index.html")
     else:
         print("  ! templates/site/index.html.tmpl not found, skipping site generation")
 
 
+def render_banner_svg(human, plus, tagline, emphasis, background=None):
+    """Render the Human++ wordmark banner SVG.
+
+    human and plus are (start, end) gradient stops for the two halves of
+    the wordmark; background fills the canvas if given.
+    """
+    font = "font-family=\"-apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', sans-serif\""
+    lines = [
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 200">',
+        '  <defs>',
+    ]
+    for gradient_id, (start, end) in (('humanGradient', human), ('plusGradient', plus)):
+        lines += [
+            f'    <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="100%" y2="100%">',
+            f'      <stop offset="0%" style="stop-color:{start}"/>',
+            f'      <stop offset="100%" style="stop-color:{end}"/>',
+            '    </linearGradient>',
+        ]
+    lines.append('  </defs>')
+    if background:
+        lines.append(f'  <rect width="800" height="200" fill="{background}"/>')
+    lines += [
+        f'  <text x="400" y="95" text-anchor="middle" {font} font-size="72" font-weight="700" letter-spacing="-3">',
+        '    <tspan fill="url(#humanGradient)">Human</tspan><tspan fill="url(#plusGradient)">++</tspan>',
+        '  </text>',
+        f'  <text x="400" y="145" text-anchor="middle" {font} font-size="20" font-weight="300" fill="{tagline}">',
+        f'    <tspan font-weight="500" fill="{emphasis}">Code is cheap.</tspan>',
+        '    <tspan> Intent is scarce.</tspan>',
+        '  </text>',
+        '</svg>',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+# (comment, label, slots) for each swatch row of the palette SVGs
+PALETTE_SVG_ROWS = (
+    ('Grayscale', 'Grayscale', PALETTE_SLOTS['grayscale']),
+    ('Loud Accents', 'Loud Accents — Diagnostics', PALETTE_SLOTS['loud']),
+    ('Quiet Accents', 'Quiet Accents — Syntax', PALETTE_SLOTS['quiet']),
+)
+
+# Swatches dark enough that their slot label is drawn in base07, not base00
+PALETTE_SVG_LIGHT_LABELS = frozenset({
+    'base00', 'base01', 'base02', 'base03', 'base0D', 'base0E', 'base15', 'base16',
+})
+
+
+def render_palette_svg(c, label_fill, outline, background=None):
+    """Render the 3x8 palette swatch grid SVG.
+
+    outline is (slot, stroke color) for the one swatch that needs an edge
+    to stand out from the page; background fills the canvas if given.
+    """
+    font = 'font-family="SF Mono, Consolas, monospace" font-size="11"'
+    lines = ['<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 320">']
+    if background:
+        lines += [f'  <rect width="800" height="320" fill="{background}"/>', '']
+
+    for row, (comment, label, slots) in enumerate(PALETTE_SVG_ROWS):
+        top = 48 + row * 100
+        if row:
+            lines.append('')
+        lines.append(f'  <!-- {comment} row -->')
+        lines.append(f'  <text x="24" y="{top - 13}" {font} fill="{label_fill}" letter-spacing="1">{label}</text>')
+        for i, slot in enumerate(slots):
+            stroke = f' stroke="{outline[1]}" stroke-width="1"' if slot == outline[0] else ''
+            lines.append(f'  <rect x="{24 + i * 96}" y="{top}" width="88" height="56" rx="8" fill="{c[slot]}"{stroke}/>')
+        lines.append('')
+        for i, slot in enumerate(slots):
+            fill = c['base07'] if slot in PALETTE_SVG_LIGHT_LABELS else c['base00']
+            lines.append(f'  <text x="{68 + i * 96}" y="{top + 34}" {font} fill="{fill}" text-anchor="middle">{slot[4:]}</text>')
+
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
+
+
 def generate_svgs(colors, meta):
     """Generate SVG assets for README and site."""
     c = colors
     assets_dir = SITE / "assets"
-    assets_dir.mkdir(parents=True, exist_ok=True)
 
     # Banner (dark mode)
-    banner_dark = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 200">
-  <defs>
-    <linearGradient id="humanGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:{c['base07']}"/>
-      <stop offset="100%" style="stop-color:{c['base05']}"/>
-    </linearGradient>
-    <linearGradient id="plusGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:{c['base0F']}"/>
-      <stop offset="100%" style="stop-color:{c['base0B']}"/>
-    </linearGradient>
-  </defs>
-  <rect width="800" height="200" fill="{c['base00']}"/>
-  <text x="400" y="95" text-anchor="middle" font-family="-apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', sans-serif" font-size="72" font-weight="700" letter-spacing="-3">
-    <tspan fill="url(#humanGradient)">Human</tspan><tspan fill="url(#plusGradient)">++</tspan>
-  </text>
-  <text x="400" y="145" text-anchor="middle" font-family="-apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', sans-serif" font-size="20" font-weight="300" fill="{c['base04']}">
-    <tspan font-weight="500" fill="{c['base07']}">Code is cheap.</tspan>
-    <tspan> Intent is scarce.</tspan>
-  </text>
-</svg>
-'''
-    (assets_dir / "banner-dark.svg").write_text(banner_dark)
+    banner_dark = render_banner_svg(
+        human=(c['base07'], c['base05']), tagline=c['base04'], emphasis=c['base07'],
+        plus=(c['base0F'], c['base0B']), background=c['base00'])
+    write_output(assets_dir / "banner-dark.svg", banner_dark)
 
     # Banner (light mode - transparent bg, inverted text)
     # Keep the ++ as lime (base0F) - it's the signature color even if contrast isn't perfect
-    banner_light = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 200">
-  <defs>
-    <linearGradient id="humanGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:{c['base00']}"/>
-      <stop offset="100%" style="stop-color:{c['base02']}"/>
-    </linearGradient>
-    <linearGradient id="plusGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:{c['base0F']}"/>
-      <stop offset="100%" style="stop-color:{c['base0B']}"/>
-    </linearGradient>
-  </defs>
-  <text x="400" y="95" text-anchor="middle" font-family="-apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', sans-serif" font-size="72" font-weight="700" letter-spacing="-3">
-    <tspan fill="url(#humanGradient)">Human</tspan><tspan fill="url(#plusGradient)">++</tspan>
-  </text>
-  <text x="400" y="145" text-anchor="middle" font-family="-apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', sans-serif" font-size="20" font-weight="300" fill="{c['base03']}">
-    <tspan font-weight="500" fill="{c['base00']}">Code is cheap.</tspan>
-    <tspan> Intent is scarce.</tspan>
-  </text>
-</svg>
-'''
-    (assets_dir / "banner-light.svg").write_text(banner_light)
-    print("  ✓ site/assets/banner-dark.svg, banner-light.svg")
+    banner_light = render_banner_svg(
+        human=(c['base00'], c['base02']), tagline=c['base03'], emphasis=c['base00'],
+        plus=(c['base0F'], c['base0B']))
+    write_output(assets_dir / "banner-light.svg", banner_light)
+    log("  ✓ site/assets/banner-dark.svg, banner-light.svg")
 
     # Palette visualization (dark mode)
-    palette_dark = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 320">
-  <rect width="800" height="320" fill="{c['base00']}"/>
-
-  <!-- Grayscale row -->
-  <text x="24" y="35" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base04']}" letter-spacing="1">Grayscale</text>
-  <rect x="24" y="48" width="88" height="56" rx="8" fill="{c['base00']}" stroke="{c['base02']}" stroke-width="1"/>
-  <rect x="120" y="48" width="88" height="56" rx="8" fill="{c['base01']}"/>
-  <rect x="216" y="48" width="88" height="56" rx="8" fill="{c['base02']}"/>
-  <rect x="312" y="48" width="88" height="56" rx="8" fill="{c['base03']}"/>
-  <rect x="408" y="48" width="88" height="56" rx="8" fill="{c['base04']}"/>
-  <rect x="504" y="48" width="88" height="56" rx="8" fill="{c['base05']}"/>
-  <rect x="600" y="48" width="88" height="56" rx="8" fill="{c['base06']}"/>
-  <rect x="696" y="48" width="88" height="56" rx="8" fill="{c['base07']}"/>
-
-  <text x="68" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">00</text>
-  <text x="164" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">01</text>
-  <text x="260" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">02</text>
-  <text x="356" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">03</text>
-  <text x="452" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">04</text>
-  <text x="548" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">05</text>
-  <text x="644" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">06</text>
-  <text x="740" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">07</text>
-
-  <!-- Loud Accents row -->
-  <text x="24" y="135" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base04']}" letter-spacing="1">Loud Accents — Diagnostics</text>
-  <rect x="24" y="148" width="88" height="56" rx="8" fill="{c['base08']}"/>
-  <rect x="120" y="148" width="88" height="56" rx="8" fill="{c['base09']}"/>
-  <rect x="216" y="148" width="88" height="56" rx="8" fill="{c['base0A']}"/>
-  <rect x="312" y="148" width="88" height="56" rx="8" fill="{c['base0B']}"/>
-  <rect x="408" y="148" width="88" height="56" rx="8" fill="{c['base0C']}"/>
-  <rect x="504" y="148" width="88" height="56" rx="8" fill="{c['base0D']}"/>
-  <rect x="600" y="148" width="88" height="56" rx="8" fill="{c['base0E']}"/>
-  <rect x="696" y="148" width="88" height="56" rx="8" fill="{c['base0F']}"/>
-
-  <text x="68" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">08</text>
-  <text x="164" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">09</text>
-  <text x="260" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0A</text>
-  <text x="356" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0B</text>
-  <text x="452" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0C</text>
-  <text x="548" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">0D</text>
-  <text x="644" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">0E</text>
-  <text x="740" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0F</text>
-
-  <!-- Quiet Accents row -->
-  <text x="24" y="235" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base04']}" letter-spacing="1">Quiet Accents — Syntax</text>
-  <rect x="24" y="248" width="88" height="56" rx="8" fill="{c['base10']}"/>
-  <rect x="120" y="248" width="88" height="56" rx="8" fill="{c['base11']}"/>
-  <rect x="216" y="248" width="88" height="56" rx="8" fill="{c['base12']}"/>
-  <rect x="312" y="248" width="88" height="56" rx="8" fill="{c['base13']}"/>
-  <rect x="408" y="248" width="88" height="56" rx="8" fill="{c['base14']}"/>
-  <rect x="504" y="248" width="88" height="56" rx="8" fill="{c['base15']}"/>
-  <rect x="600" y="248" width="88" height="56" rx="8" fill="{c['base16']}"/>
-  <rect x="696" y="248" width="88" height="56" rx="8" fill="{c['base17']}"/>
-
-  <text x="68" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">10</text>
-  <text x="164" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">11</text>
-  <text x="260" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">12</text>
-  <text x="356" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">13</text>
-  <text x="452" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">14</text>
-  <text x="548" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">15</text>
-  <text x="644" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">16</text>
-  <text x="740" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">17</text>
-</svg>
-'''
-    (assets_dir / "palette-dark.svg").write_text(palette_dark)
+    palette_dark = render_palette_svg(
+        c, label_fill=c['base04'], outline=('base00', c['base02']), background=c['base00'])
+    write_output(assets_dir / "palette-dark.svg", palette_dark)
 
     # Palette visualization (light mode - transparent bg)
-    palette_light = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 320">
-  <!-- Grayscale row -->
-  <text x="24" y="35" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base03']}" letter-spacing="1">Grayscale</text>
-  <rect x="24" y="48" width="88" height="56" rx="8" fill="{c['base00']}"/>
-  <rect x="120" y="48" width="88" height="56" rx="8" fill="{c['base01']}"/>
-  <rect x="216" y="48" width="88" height="56" rx="8" fill="{c['base02']}"/>
-  <rect x="312" y="48" width="88" height="56" rx="8" fill="{c['base03']}"/>
-  <rect x="408" y="48" width="88" height="56" rx="8" fill="{c['base04']}"/>
-  <rect x="504" y="48" width="88" height="56" rx="8" fill="{c['base05']}"/>
-  <rect x="600" y="48" width="88" height="56" rx="8" fill="{c['base06']}"/>
-  <rect x="696" y="48" width="88" height="56" rx="8" fill="{c['base07']}" stroke="{c['base04']}" stroke-width="1"/>
-
-  <text x="68" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">00</text>
-  <text x="164" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">01</text>
-  <text x="260" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">02</text>
-  <text x="356" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">03</text>
-  <text x="452" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">04</text>
-  <text x="548" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">05</text>
-  <text x="644" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">06</text>
-  <text x="740" y="82" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">07</text>
-
-  <!-- Loud Accents row -->
-  <text x="24" y="135" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base03']}" letter-spacing="1">Loud Accents — Diagnostics</text>
-  <rect x="24" y="148" width="88" height="56" rx="8" fill="{c['base08']}"/>
-  <rect x="120" y="148" width="88" height="56" rx="8" fill="{c['base09']}"/>
-  <rect x="216" y="148" width="88" height="56" rx="8" fill="{c['base0A']}"/>
-  <rect x="312" y="148" width="88" height="56" rx="8" fill="{c['base0B']}"/>
-  <rect x="408" y="148" width="88" height="56" rx="8" fill="{c['base0C']}"/>
-  <rect x="504" y="148" width="88" height="56" rx="8" fill="{c['base0D']}"/>
-  <rect x="600" y="148" width="88" height="56" rx="8" fill="{c['base0E']}"/>
-  <rect x="696" y="148" width="88" height="56" rx="8" fill="{c['base0F']}"/>
-
-  <text x="68" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">08</text>
-  <text x="164" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">09</text>
-  <text x="260" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0A</text>
-  <text x="356" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0B</text>
-  <text x="452" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0C</text>
-  <text x="548" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">0D</text>
-  <text x="644" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">0E</text>
-  <text x="740" y="182" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">0F</text>
-
-  <!-- Quiet Accents row -->
-  <text x="24" y="235" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base03']}" letter-spacing="1">Quiet Accents — Syntax</text>
-  <rect x="24" y="248" width="88" height="56" rx="8" fill="{c['base10']}"/>
-  <rect x="120" y="248" width="88" height="56" rx="8" fill="{c['base11']}"/>
-  <rect x="216" y="248" width="88" height="56" rx="8" fill="{c['base12']}"/>
-  <rect x="312" y="248" width="88" height="56" rx="8" fill="{c['base13']}"/>
-  <rect x="408" y="248" width="88" height="56" rx="8" fill="{c['base14']}"/>
-  <rect x="504" y="248" width="88" height="56" rx="8" fill="{c['base15']}"/>
-  <rect x="600" y="248" width="88" height="56" rx="8" fill="{c['base16']}"/>
-  <rect x="696" y="248" width="88" height="56" rx="8" fill="{c['base17']}"/>
-
-  <text x="68" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">10</text>
-  <text x="164" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">11</text>
-  <text x="260" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">12</text>
-  <text x="356" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">13</text>
-  <text x="452" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">14</text>
-  <text x="548" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">15</text>
-  <text x="644" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" text-anchor="middle">16</text>
-  <text x="740" y="282" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" text-anchor="middle">17</text>
-</svg>
-'''
-    (assets_dir / "palette-light.svg").write_text(palette_light)
-    print("  ✓ site/assets/palette-dark.svg, palette-light.svg")
+    palette_light = render_palette_svg(
+        c, label_fill=c['base03'], outline=('base07', c['base04']))
+    write_output(assets_dir / "palette-light.svg", palette_light)
+    log("  ✓ site/assets/palette-dark.svg, palette-light.svg")
 
     # Code preview (dark mode)
     preview_dark = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 680 340">
@@ -1344,7 +1359,7 @@ def generate_svgs(colors, meta):
   <text x="188" y="308" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base00']}" font-weight="600">Type 'null' is not assignable to 'string'</text>
 </svg>
 '''
-    (assets_dir / "preview-dark.svg").write_text(preview_dark)
+    write_output(assets_dir / "preview-dark.svg", preview_dark)
 
     # Code preview (light mode)
     preview_light = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 680 340">
@@ -1450,8 +1465,8 @@ def generate_svgs(colors, meta):
   <text x="188" y="308" font-family="SF Mono, Consolas, monospace" font-size="11" fill="{c['base07']}" font-weight="600">Type 'null' is not assignable to 'string'</text>
 </svg>
 '''
-    (assets_dir / "preview-light.svg").write_text(preview_light)
-    print("  ✓ site/assets/preview-dark.svg, preview-light.svg")
+    write_output(assets_dir / "preview-light.svg", preview_light)
+    log("  ✓ site/assets/preview-dark.svg, preview-light.svg")
 
 
 
@@ -1467,15 +1482,11 @@ def generate_readme(colors, meta):
         print("  ⚠ README template not found, skipping")
         return
 
-    content = template_path.read_text()
-
     # Replace all {{baseXX}} placeholders with current palette values
-    for slot, hex_value in colors.items():
-        placeholder = '{{' + slot + '}}'
-        content = content.replace(placeholder, hex_value.lower())
+    content = render_slots(load_template(template_path), colors)
 
-    (ROOT / "README.md").write_text(content)
-    print("  ✓ README.md")
+    write_output(ROOT / "README.md", content)
+    log("  ✓ README.md")
 
 
 def generate_colortest(colors, meta):
@@ -1647,19 +1658,13 @@ done
 echo ""
 '''
 
-    (DIST / "scripts").mkdir(parents=True, exist_ok=True)
-    (DIST / "scripts/colortest.sh").write_text(content)
+    write_output(DIST / "scripts/colortest.sh", content)
     os.chmod(DIST / "scripts/colortest.sh", 0o755)
-    print("  ✓ dist/scripts/colortest.sh")
+    log("  ✓ dist/scripts/colortest.sh")
 
 
 def generate_base24_yaml(colors, meta):
     """Generate human-plus-plus.yaml (Base24 registry format)."""
-    # Order colors properly
-    grayscale = [f'base0{i}' for i in range(8)]
-    loud = ['base08', 'base09', 'base0A', 'base0B', 'base0C', 'base0D', 'base0E', 'base0F']
-    quiet = ['base10', 'base11', 'base12', 'base13', 'base14', 'base15', 'base16', 'base17']
-
     lines = [
         'system: "base24"',
         f'name: "{meta.get("name", "Human++")}"',
@@ -1670,29 +1675,26 @@ def generate_base24_yaml(colors, meta):
 
     # Grayscale
     lines.append('  # Cool gray base')
-    for slot in grayscale:
+    for slot in PALETTE_SLOTS['grayscale']:
         lines.append(f'  {slot}: "{colors[slot]}"')
 
     # Loud accents
     lines.append('  # Loud accents (diagnostics, signals)')
-    for slot in loud:
+    for slot in PALETTE_SLOTS['loud']:
         lines.append(f'  {slot}: "{colors[slot]}"')
 
     # Quiet accents
     lines.append('  # Quiet accents (syntax, UI state)')
-    for slot in quiet:
+    for slot in PALETTE_SLOTS['quiet']:
         lines.append(f'  {slot}: "{colors[slot]}"')
 
     content = '\n'.join(lines) + '\n'
-    (DIST / "base24").mkdir(parents=True, exist_ok=True)
-    (DIST / "base24/human-plus-plus.yaml").write_text(content)
-    print("  ✓ dist/base24/human-plus-plus.yaml")
+    write_output(DIST / "base24/human-plus-plus.yaml", content)
+    log("  ✓ dist/base24/human-plus-plus.yaml")
 
 
 def generate_tinty_themes(colors, meta):
     """Generate tinty theme files."""
-    c = {k: hex_to_components(v) for k, v in colors.items()}
-
     # Build template vars
     vars = {
         'scheme-name': meta.get('name', 'Human++'),
@@ -1701,18 +1703,18 @@ def generate_tinty_themes(colors, meta):
         'scheme-system': 'base24',
     }
 
-    for key, value in colors.items():
-        comps = hex_to_components(value)
-        vars[f'{key}-hex'] = comps['hex']
-        vars[f'{key}-hex-r'] = comps['hex_r']
-        vars[f'{key}-hex-g'] = comps['hex_g']
-        vars[f'{key}-hex-b'] = comps['hex_b']
-        vars[f'{key}-rgb-r'] = comps['rgb_r']
-        vars[f'{key}-rgb-g'] = comps['rgb_g']
-        vars[f'{key}-rgb-b'] = comps['rgb_b']
-        vars[f'{key}-dec-r'] = comps['dec_r']
-        vars[f'{key}-dec-g'] = comps['dec_g']
-        vars[f'{key}-dec-b'] = comps['dec_b']
+    c = palette_components(colors)
+    for key, comps in c.items():
+        vars[f'{key}-hex'] = comps.hex
+        vars[f'{key}-hex-r'] = comps.hex_r
+        vars[f'{key}-hex-g'] = comps.hex_g
+        vars[f'{key}-hex-b'] = comps.hex_b
+        vars[f'{key}-rgb-r'] = comps.rgb_r
+        vars[f'{key}-rgb-g'] = comps.rgb_g
+        vars[f'{key}-rgb-b'] = comps.rgb_b
+        vars[f'{key}-dec-r'] = comps.dec_r
+        vars[f'{key}-dec-g'] = comps.dec_g
+        vars[f'{key}-dec-b'] = comps.dec_b
 
     def render_mustache(template_content):
         result = template_content
@@ -1725,28 +1727,27 @@ def generate_tinty_themes(colors, meta):
     shell_template = TINTY_DATA / "repos/tinted-shell/templates/base24.mustache"
     shell_output = TINTY_DATA / "repos/tinted-shell/scripts/base24-human-plus-plus.sh"
     if shell_template.exists():
-        output = render_mustache(shell_template.read_text())
-        shell_output.write_text(output)
+        output = render_mustache(load_template(shell_template))
+        write_output(shell_output, output)
         os.chmod(shell_output, 0o755)
 
         # Also copy to local dist
-        (DIST / "base24").mkdir(parents=True, exist_ok=True)
-        (DIST / "base24/base24-human-plus-plus.sh").write_text(output)
-        print("  ✓ dist/base24/base24-human-plus-plus.sh")
+        write_output(DIST / "base24/base24-human-plus-plus.sh", output)
+        log("  ✓ dist/base24/base24-human-plus-plus.sh")
 
     # Vim
     vim_template = TINTY_DATA / "repos/tinted-vim/templates/tinted-vim.mustache"
     vim_output = TINTY_DATA / "repos/tinted-vim/colors/base24-human-plus-plus.vim"
     if vim_template.exists():
-        output = render_mustache(vim_template.read_text())
-        vim_output.write_text(output)
-        print("  ✓ tinty vim theme")
+        output = render_mustache(load_template(vim_template))
+        write_output(vim_output, output)
+        log("  ✓ tinty vim theme")
 
     # Ghostty (for tinty)
     ghostty_template = TINTY_DATA / "repos/tinted-ghostty/templates/base24.mustache"
     ghostty_output = TINTY_DATA / "repos/tinted-ghostty/themes/base24-human-plus-plus"
     if ghostty_template.exists():
-        output = render_mustache(ghostty_template.read_text())
+        output = render_mustache(load_template(ghostty_template))
         # Customize foreground to base07
         output = output.replace(
             f"foreground = {vars['base05-hex']}",
@@ -1756,8 +1757,8 @@ def generate_tinty_themes(colors, meta):
             f"cursor-color = {vars['base05-hex']}",
             f"cursor-color = {vars['base07-hex']}"
         )
-        ghostty_output.write_text(output)
-        print("  ✓ tinty ghostty theme")
+        write_output(ghostty_output, output)
+        log("  ✓ tinty ghostty theme")
 
 
 def generate_vscode_theme(colors, meta):
@@ -1766,32 +1767,25 @@ def generate_vscode_theme(colors, meta):
     Uses mustache-style placeholders ({{base00}}, {{base08}}, etc.) in
     templates/vscode/human-plus-plus.json.tmpl and renders with current palette.
     """
-    import shutil
-
     template_path = ROOT / "templates/vscode/human-plus-plus.json.tmpl"
 
     if not template_path.exists():
         print("  ⚠ VS Code template not found, skipping")
         return
 
-    content = template_path.read_text()
-
     # Replace all {{baseXX}} placeholders with current palette values
-    for slot, hex_value in colors.items():
-        placeholder = '{{' + slot + '}}'
-        content = content.replace(placeholder, hex_value.lower())
+    content = render_slots(load_template(template_path), colors)
 
     # Write to dist/
-    (DIST / "vscode").mkdir(parents=True, exist_ok=True)
     theme_path = DIST / "vscode/human-plus-plus.json"
-    theme_path.write_text(content)
-    print("  ✓ dist/vscode/human-plus-plus.json")
+    write_output(theme_path, content)
+    log("  ✓ dist/vscode/human-plus-plus.json")
 
     # Also copy to vscode-extension package
     ext_theme_path = PACKAGES / "vscode-extension/themes/human-plus-plus.json"
     if ext_theme_path.parent.exists():
-        shutil.copy(theme_path, ext_theme_path)
-        print("  ✓ packages/vscode-extension/themes/human-plus-plus.json")
+        write_output(ext_theme_path, content)
+        log("  ✓ packages/vscode-extension/themes/human-plus-plus.json")
 
 
 # =============================================================================
@@ -1799,11 +1793,15 @@ def generate_vscode_theme(colors, meta):
 # =============================================================================
 
 def main():
-    print("Building Human++ from palette.toml...\n")
+    global QUIET
+    QUIET = '--quiet' in sys.argv[1:]
+    git_output.cache_clear()
+
+    log("Building Human++ from palette.toml...\n")
 
     colors, meta = parse_palette()
 
-    print("Generating configs:")
+    log("Generating configs:")
     generate_ghostty(colors, meta)
     generate_sketchybar(colors, meta)
     generate_borders(colors, meta)
@@ -1817,21 +1815,21 @@ def main():
     generate_shell_init(colors, meta)
     generate_colortest(colors, meta)
 
-    print("\nGenerating site:")
+    log("\nGenerating site:")
     generate_palette_json(colors, meta)
     generate_site(colors, meta)
     generate_svgs(colors, meta)
     generate_readme(colors, meta)
 
-    print("\nGenerating theme registry files:")
+    log("\nGenerating theme registry files:")
     generate_base24_yaml(colors, meta)
     generate_tinty_themes(colors, meta)
 
-    print("\nGenerating VS Code theme:")
+    log("\nGenerating VS Code theme:")
     generate_vscode_theme(colors, meta)
 
-    print("\n✓ Build complete!")
-    print("\nTo apply: tinty apply base24-human-plus-plus")
+    log("\n✓ Build complete!")
+    log("\nTo apply: tinty apply base24-human-plus-plus")
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 """
 Palette parsing and validation for Human++ color scheme.
 """
+import tomllib
 from pathlib import Path
 from typing import Dict, Tuple, Any
 
@@ -12,35 +13,27 @@ BASE24_SLOTS = [
 ]
 
 
-def load_palette(palette_path: Path) -> Tuple[Dict[str, str], Dict[str, str]]:
-    """
-    Parse palette.toml and return (colors, meta) dicts.
+# Top-level string keys that describe the palette rather than a color
+META_KEYS = ('name', 'author', 'description')
 
-    colors: {'base00': '#1a1c22', ...}
-    meta: {'name': '...', 'author': '...', 'description': '...'}
+
+def split_palette(data: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
-    content = palette_path.read_text()
+    Pull (colors, meta) out of parsed palette TOML.
 
+    Sections ([meta], [base16], [base24]) are only for readability, and
+    flat files (e.g. derive_base24.py --out) keep every key top-level,
+    so both the top-level table and its sub-tables are scanned.
+    """
     colors = {}
     meta = {}
 
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#') or line.startswith('['):
-            continue
-
-        if '=' in line:
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Remove quotes
-            if value.startswith('"') and '"' in value[1:]:
-                value = value[1:value.index('"', 1)]
-            elif value.startswith("'") and "'" in value[1:]:
-                value = value[1:value.index("'", 1)]
-
-            if key in ['name', 'author', 'description']:
+    tables = (data, *(t for t in data.values() if isinstance(t, dict)))
+    for table in tables:
+        for key, value in table.items():
+            if not isinstance(value, str):
+                continue
+            if key in META_KEYS:
                 meta[key] = value
             elif key.startswith('base') and value.startswith('#'):
                 colors[key] = value
@@ -48,6 +41,17 @@ def load_palette(palette_path: Path) -> Tuple[Dict[str, str], Dict[str, str]]:
     return colors, meta
 
 
+def load_palette(palette_path: Path) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Parse palette.toml and return (colors, meta) dicts.
+
+    colors: {'base00': '#1a1c22', ...}
+    meta: {'name': '...', 'author': '...', 'description': '...'}
+    """
+    with palette_path.open('rb') as f:
+        return split_palette(tomllib.load(f))
+
+
 def validate_palette(colors: Dict[str, str]) -> list:
     """
     Validate that all Base24 slots are present and have valid hex colors.